@@ -1,95 +1,175 @@
 #!/usr/bin/env python3
 """
-Flask Web Application for Wikipedia Word Cloud Visualization
+Quart Web Application for Wikipedia Word Cloud Visualization
 
 This web app displays word frequency data from Wikipedia categories as interactive word clouds.
 It uses cached data when available, otherwise computes frequencies from scratch.
+
+Run under an ASGI server so concurrent requests share one event loop:
+    hypercorn app:app --workers 1 --worker-class asyncio
 """
 
-from flask import Flask, render_template, request, jsonify
-import json
+from quart import Quart, Response, render_template, request
 import os
+import asyncio
+import gzip
+import hashlib
+import orjson
 from wikipedia_category_analyzer import WikipediaAnalyzer
 from color_palette import get_all_color_palettes
 import traceback
 import random
+import operator
+import numpy as np
+from collections import OrderedDict
 
-app = Flask(__name__)
+app = Quart(__name__)
 
 # Global analyzer instance
 analyzer = WikipediaAnalyzer()
 
+# Color palettes are static, so look them up once at startup
+palettes = get_all_color_palettes()
+
+# Most recently used categories' words sorted by frequency, with the
+# modification time of the analysis cache they were computed from
+SORTED_WORDS_CACHE_SIZE = 64
+sorted_words_cache = OrderedDict()
+
+async def get_sorted_word_items(category):
+    """Get a category's (word, frequency) pairs sorted by descending frequency."""
+    cached = sorted_words_cache.get(category)
+    if cached and cached[0] == analyzer.get_analysis_mtime(category):
+        sorted_words_cache.move_to_end(category)
+        return cached[1]
+    
+    # Get word frequencies (will use cache if available)
+    word_freq = await analyzer.analyze_category_async(category)
+    # Sorting the full vocabulary is CPU-bound, so keep it off the event loop
+    sorted_items = await asyncio.to_thread(
+        lambda: tuple(sorted(word_freq.items(), key=operator.itemgetter(1), reverse=True))
+    )
+    
+    mtime = analyzer.get_analysis_mtime(category)
+    if sorted_items and mtime is not None:
+        sorted_words_cache[category] = (mtime, sorted_items)
+        sorted_words_cache.move_to_end(category)
+        if len(sorted_words_cache) > SORTED_WORDS_CACHE_SIZE:
+            sorted_words_cache.popitem(last=False)
+    
+    return sorted_items
+
+# Analysis results only change when a category is re-analyzed, so let clients cache them
+ANALYSIS_MAX_AGE = 3600
+
+# JSON responses smaller than this are sent uncompressed
+COMPRESS_MIN_SIZE = 500
+
+# JSON responses at least this large are compressed in a worker thread
+COMPRESS_THREAD_MIN_SIZE = 64 * 1024
+
+def orjsonify(data):
+    """Build a JSON response, serialized with orjson."""
+    return Response(orjson.dumps(data), mimetype='application/json')
+
+def get_analysis_etag(category, variant=''):
+    """Get an ETag for a response built from a category's cached analysis, if there is one."""
+    mtime = analyzer.get_analysis_mtime(category)
+    if mtime is None:
+        return None
+    return hashlib.md5(f"{category}:{variant}:{mtime}".encode()).hexdigest()
+
+def add_cache_headers(response, etag):
+    """Mark a response as cacheable by clients."""
+    response.headers['Cache-Control'] = f'public, max-age={ANALYSIS_MAX_AGE}'
+    if etag:
+        # Weak, since gzipped and plain bodies share the tag
+        response.set_etag(etag, weak=True)
+    return response
+
+def not_modified(etag):
+    """Get a 304 response if the client already holds the ETag, otherwise None."""
+    if etag and request.if_none_match.contains_weak(etag):
+        return add_cache_headers(Response('', status=304), etag)
+    return None
+
+@app.after_request
+async def compress_response(response):
+    """Gzip JSON responses for clients that accept it."""
+    if (response.status_code != 200
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers
+            or not request.accept_encodings['gzip']):
+        return response
+    
+    data = await response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    if len(data) >= COMPRESS_THREAD_MIN_SIZE:
+        # Large bodies (such as a full vocabulary) would stall the event loop
+        compressed = await asyncio.to_thread(gzip.compress, data, 6)
+    else:
+        compressed = gzip.compress(data, compresslevel=6)
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/')
-def index():
+async def index():
     """Main page with word cloud visualization."""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 @app.route('/api/categories')
-def get_cached_categories():
+async def get_cached_categories():
     """Get list of cached categories."""
     try:
-        cache_dir = analyzer.cache_dir
-        if not os.path.exists(cache_dir):
-            return jsonify([])
-        
-        categories = []
-        for filename in os.listdir(cache_dir):
-            if filename.endswith('_analysis.json'):
-                # Extract category name from filename
-                parts = filename.replace('_analysis.json', '').split('_')
-                if len(parts) >= 2:
-                    # Remove hash part (last 8 characters)
-                    category_parts = parts[:-1]
-                    category = '_'.join(category_parts)
-                    
-                    # Load cache to get metadata
-                    cache_path = os.path.join(cache_dir, filename)
-                    try:
-                        with open(cache_path, 'r', encoding='utf-8') as f:
-                            cache_data = json.load(f)
-                            categories.append({
-                                'name': cache_data.get('category', category),
-                                'display_name': cache_data.get('category', category).replace('_', ' '),
-                                'total_words': cache_data.get('total_unique_words', 0),
-                                'total_occurrences': cache_data.get('total_word_occurrences', 0),
-                                'analyzed_at': cache_data.get('analyzed_at', 'Unknown')
-                            })
-                    except (json.JSONDecodeError, FileNotFoundError):
-                        continue
-        
-        return jsonify(categories)
+        categories = [
+            {
+                'name': entry['category'],
+                'display_name': entry['category'].replace('_', ' '),
+                'total_words': entry['total_unique_words'],
+                'total_occurrences': entry['total_word_occurrences'],
+                'analyzed_at': entry['analyzed_at']
+            }
+            for entry in analyzer.get_cache_index().values()
+        ]
+        
+        return orjsonify(categories)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return orjsonify({'error': str(e)}), 500
 
 @app.route('/api/analyze/<category>')
-def analyze_category(category):
+async def analyze_category(category):
     """Analyze a Wikipedia category and return word frequency data."""
     try:
         # Replace spaces with underscores for Wikipedia category format
         category = category.replace(' ', '_')
         
-        # Get word frequencies (will use cache if available)
-        word_freq = analyzer.analyze_category(category)
+        cached_response = not_modified(get_analysis_etag(category))
+        if cached_response:
+            return cached_response
+        
+        # Get words sorted by frequency (descending)
+        sorted_items = await get_sorted_word_items(category)
         
-        if not word_freq:
-            return jsonify({'error': 'No data found for this category'}), 404
+        if not sorted_items:
+            return orjsonify({'error': 'No data found for this category'}), 404
         
         # Convert to list of dictionaries for easier frontend handling
         word_data = [
             {'word': word, 'frequency': freq}
-            for word, freq in word_freq.items()
+            for word, freq in sorted_items
         ]
         
-        # Sort by frequency (descending)
-        word_data.sort(key=lambda x: x['frequency'], reverse=True)
-        
         # Calculate statistics
-        total_words = len(word_data)
-        total_occurrences = sum(item['frequency'] for item in word_data)
-        max_frequency = word_data[0]['frequency'] if word_data else 0
-        min_frequency = word_data[-1]['frequency'] if word_data else 0
+        total_words = len(sorted_items)
+        total_occurrences = sum(freq for _, freq in sorted_items)
+        max_frequency = sorted_items[0][1]
+        min_frequency = sorted_items[-1][1]
         
-        return jsonify({
+        return add_cache_headers(orjsonify({
             'category': category,
             'words': word_data,
             'stats': {
@@ -98,84 +178,85 @@ def analyze_category(category):
                 'max_frequency': max_frequency,
                 'min_frequency': min_frequency
             }
-        })
+        }), get_analysis_etag(category))
         
     except Exception as e:
         print(f"Error analyzing category '{category}': {e}")
         traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        return orjsonify({'error': str(e)}), 500
 
 @app.route('/api/color-palettes')
-def get_color_palettes():
+async def get_color_palettes():
     """Get all available color palettes."""
     try:
-        palettes = get_all_color_palettes()
         palette_data = {}
         for name, palette in palettes.items():
             palette_data[name] = {
                 'name': name.title(),
                 'colors': palette.colors
             }
-        return jsonify(palette_data)
+        return orjsonify(palette_data)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return orjsonify({'error': str(e)}), 500
 
 @app.route('/api/word-cloud/<category>')
 @app.route('/api/word-cloud/<category>/<palette_name>')
-def get_word_cloud_data(category, palette_name='pastel'):
+async def get_word_cloud_data(category, palette_name='pastel'):
     """Get word cloud data for a specific category."""
     try:
         # Replace spaces with underscores for Wikipedia category format
         category = category.replace(' ', '_')
         
-        # Get word frequencies
-        word_freq = analyzer.analyze_category(category)
+        cached_response = not_modified(get_analysis_etag(category, palette_name))
+        if cached_response:
+            return cached_response
         
-        if not word_freq:
-            return jsonify({'error': 'No data found for this category'}), 404
+        # Get words sorted by frequency (descending)
+        sorted_items = await get_sorted_word_items(category)
         
-        # Get the selected color palette
-        palettes = get_all_color_palettes()
-        if palette_name not in palettes:
-            palette_name = 'pastel'  # Default fallback
-        selected_palette = palettes[palette_name]
+        if not sorted_items:
+            return orjsonify({'error': 'No data found for this category'}), 404
+        
+        # Get the selected color palette (pastel is the default fallback)
+        selected_palette = palettes.get(palette_name, palettes['pastel'])
+        colors = selected_palette.colors
+        num_colors = len(colors)
         
         # Prepare data for word cloud (limit to top 100 words for performance)
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        top_words = sorted_words[:100]
+        top_words = sorted_items[:100]
         
         # Calculate relative sizes (normalize to 10-100 range for better visualization)
         if top_words:
-            max_freq = top_words[0][1]
-            min_freq = top_words[-1][1]
-            freq_range = max_freq - min_freq if max_freq != min_freq else 1
+            freqs = np.fromiter((freq for _, freq in top_words), dtype=np.float64, count=len(top_words))
+            freq_range = np.ptp(freqs) or 1
+            sizes = (10 + 90 * (freqs - freqs.min()) / freq_range).astype(np.int32)
             
-            word_cloud_data = []
-            for i, (word, freq) in enumerate(top_words):
-                # Normalize frequency to 10-100 range
-                normalized_size = 10 + (90 * (freq - min_freq) / freq_range)
-                # Assign color from palette (cycle through colors)
-                color = selected_palette.colors[i % len(selected_palette.colors)]
-                word_cloud_data.append({
+            # Assign colors from palette (cycle through colors)
+            cycled_colors = colors * (len(top_words) // num_colors + 1)
+            
+            word_cloud_data = [
+                {
                     'text': word,
-                    'size': int(normalized_size),
+                    'size': size,
                     'frequency': freq,
                     'color': color
-                })
+                }
+                for (word, freq), size, color in zip(top_words, sizes.tolist(), cycled_colors)
+            ]
         else:
             word_cloud_data = []
         
-        return jsonify({
+        return add_cache_headers(orjsonify({
             'category': category,
             'words': word_cloud_data,
-            'total_words': len(word_freq),
+            'total_words': len(sorted_items),
             'displayed_words': len(word_cloud_data)
-        })
+        }), get_analysis_etag(category, palette_name))
         
     except Exception as e:
         print(f"Error getting word cloud data for '{category}': {e}")
         traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        return orjsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 class ColorPalette:
     def __init__(self, colors):
         self.colors = colors
@@ -22,11 +24,14 @@ class RGBPalette(ColorPalette):
     def __init__(self):
         super().__init__(["#ff0000", "#00ff00", "#0000ff", "#ffff00", "#ff00ff", "#00ffff"])    
 
+# Palettes never change, so build them once and share a read-only view
+_PALETTES = MappingProxyType({
+    "pastel": PastelPalette(),
+    "bright": BrightPalette(),
+    "dark": DarkPalette(),
+    "neutral": NeutralPalette(),
+    "rgb": RGBPalette()
+})
+
 def get_all_color_palettes():
-    return {
-        "pastel": PastelPalette(),
-        "bright": BrightPalette(),
-        "dark": DarkPalette(),
-        "neutral": NeutralPalette(),
-        "rgb": RGBPalette()
-    }
\ No newline at end of file
+    return _PALETTES
\ No newline at end of file
@@ -13,54 +13,121 @@ Example:
 """
 
 import argparse
+import asyncio
+import heapq
+import operator
+import aiohttp
 import requests
 import re
 import sys
 from collections import Counter
-from typing import List, Dict, Set
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from itertools import filterfalse
+from typing import List, Dict, FrozenSet, Optional, Set
 import time
 import json
+import mmap
+import msgpack
+import orjson
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import hashlib
 from datetime import datetime, timedelta
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
 # Disable urllib3 warnings about SSL
 urllib3.disable_warnings(urllib3.exceptions.NotOpenSSLWarning)
 
 # Common English stop words to filter out
-STOP_WORDS = {
+STOP_WORDS: FrozenSet[str] = frozenset((
     'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he',
     'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'will', 'with',
     'or', 'but', 'not', 'this', 'they', 'their', 'them', 'these', 'those', 'then',
     'than', 'there', 'where', 'when', 'who', 'what', 'which', 'why', 'how', 'can',
-    'could', 'would', 'should', 'may', 'might', 'must', 'shall', 'will', 'do', 'did',
-    'does', 'have', 'had', 'having', 'been', 'being', 'am', 'is', 'are', 'was', 'were',
-    'i', 'you', 'we', 'they', 'me', 'him', 'her', 'us', 'my', 'your', 'his', 'her',
+    'could', 'would', 'should', 'may', 'might', 'must', 'shall', 'do', 'did',
+    'does', 'have', 'had', 'having', 'been', 'being', 'am', 'were',
+    'i', 'you', 'we', 'me', 'him', 'her', 'us', 'my', 'your', 'his',
     'our', 'also', 'all', 'any', 'some', 'each', 'every', 'no', 'none', 'one', 'two',
     'first', 'last', 'other', 'another', 'more', 'most', 'many', 'much', 'few', 'less',
     'such', 'same', 'different', 'new', 'old', 'good', 'bad', 'big', 'small', 'long',
-    'short', 'high', 'low', 'right', 'left', 'up', 'down', 'here', 'there', 'now',
-    'then', 'today', 'tomorrow', 'yesterday', 'always', 'never', 'sometimes', 'often',
+    'short', 'high', 'low', 'right', 'left', 'up', 'down', 'here', 'now',
+    'today', 'tomorrow', 'yesterday', 'always', 'never', 'sometimes', 'often',
     'usually', 'again', 'once', 'twice', 'very', 'too', 'so', 'just', 'only', 'even',
     'still', 'yet', 'already', 'almost', 'quite', 'rather', 'really', 'actually',
     'probably', 'perhaps', 'maybe', 'certainly', 'definitely', 'absolutely', 'exactly',
     'completely', 'totally', 'entirely', 'particularly', 'especially', 'generally',
     'specifically', 'basically', 'essentially', 'mainly', 'mostly', 'largely',
-    'partly', 'slightly', 'somewhat', 'fairly', 'pretty', 'enough', 'too', 'very'
-}
+    'partly', 'slightly', 'somewhat', 'fairly', 'pretty', 'enough',
+))
+
+# Words of three or more letters, in any case
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Stop words the tokenizer can actually produce (shorter words never match _WORD_RE)
+_STOP = frozenset(word for word in STOP_WORDS if len(word) >= 3)
+
+def _iter_words(text: str):
+    """Iterate over the lowercased non-stop words of text."""
+    # Chain C-implemented builtins so no Python bytecode runs per token
+    return filterfalse(_STOP.__contains__, map(str.lower, _WORD_RE.findall(text)))
+
+# Analysis fields recorded in the cache index
+INDEX_FIELDS = ('category', 'total_unique_words', 'total_word_occurrences', 'analyzed_at')
+
+# Longest extract the API will return when a character limit is requested
+MAX_EXTRACT_CHARS = 1200
+
+# Maximum number of extracts queries in flight at once
+MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum number of categories warmed in parallel; each worker runs its own
+# MAX_CONCURRENT_REQUESTS queries, so this bounds the total load on the API
+MAX_WARM_WORKERS = 8
 
 class WikipediaAnalyzer:
-    def __init__(self, cache_dir: str = "cache", cache_expiry_days: int = 7):
+    def __init__(self, cache_dir: str = "cache", cache_expiry_days: int = 7,
+                 extract_chars: Optional[int] = None):
         self.base_url = "https://en.wikipedia.org/w/api.php"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'WikipediaAnalyzer/1.0 (Educational Purpose)'
-        })
+        self.user_agent = 'WikipediaAnalyzer/1.0 (Educational Purpose)'
+        # Created on first use so each worker process opens its own connections
+        self._session = None
         self.cache_dir = cache_dir
         self.cache_expiry_days = cache_expiry_days
+        # Characters of each page to analyze (None for the full page)
+        if extract_chars is not None and extract_chars < 1:
+            raise ValueError(f"extract_chars must be at least 1, got {extract_chars}")
+        self.extract_chars = min(extract_chars, MAX_EXTRACT_CHARS) if extract_chars is not None else None
         self._ensure_cache_dir()
     
+    def __getstate__(self):
+        """Pickle the analyzer without its HTTP session, which must not cross processes."""
+        state = self.__dict__.copy()
+        state['_session'] = None
+        return state
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for MediaWiki API requests, created on first use."""
+        if self._session is None:
+            session = requests.Session()
+            session.headers.update({'User-Agent': self.user_agent})
+            # Keep enough pooled connections for concurrent callers and retry transient failures
+            adapter = HTTPAdapter(
+                pool_connections=MAX_CONCURRENT_REQUESTS,
+                pool_maxsize=MAX_CONCURRENT_REQUESTS,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+    
     def _ensure_cache_dir(self):
         """Create cache directory if it doesn't exist."""
         if not os.path.exists(self.cache_dir):
@@ -71,7 +138,14 @@ class WikipediaAnalyzer:
         # Create a hash of the category name for safe filename
         category_hash = hashlib.md5(category.encode()).hexdigest()[:8]
         safe_category = re.sub(r'[^a-zA-Z0-9_-]', '_', category)
-        return os.path.join(self.cache_dir, f"{safe_category}_{category_hash}_{cache_type}.json")
+        # Word frequency tables are large, so store them in a compact binary format
+        extension = "msgpack" if cache_type.startswith("analysis") else "json"
+        return os.path.join(self.cache_dir, f"{safe_category}_{category_hash}_{cache_type}.{extension}")
+    
+    def _get_analysis_cache_filename(self, category: str) -> str:
+        """Generate the analysis cache filename, keeping length-limited analyses separate."""
+        cache_type = f"analysis_{self.extract_chars}chars" if self.extract_chars else "analysis"
+        return self._get_cache_filename(category, cache_type)
     
     def _is_cache_valid(self, cache_file: str) -> bool:
         """Check if cache file exists and is not expired."""
@@ -87,18 +161,153 @@ class WikipediaAnalyzer:
     def _load_cache(self, cache_file: str) -> dict:
         """Load data from cache file."""
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            # Parse straight from the mapped file instead of reading it into a string first
+            with open(cache_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as buf:
+                        if cache_file.endswith('.msgpack'):
+                            return msgpack.unpackb(buf, raw=False)
+                        return orjson.loads(buf)
+        except (OSError, ValueError):
             return {}
     
-    def _save_cache(self, cache_file: str, data: dict):
-        """Save data to cache file."""
+    def _save_cache(self, cache_file: str, data: dict) -> bool:
+        """Save data to cache file. Returns whether the file was written."""
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if cache_file.endswith('.msgpack'):
+                payload = msgpack.packb(data, use_bin_type=True)
+            else:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            with open(cache_file, 'wb') as f:
+                f.write(payload)
+            return True
         except Exception as e:
             print(f"Warning: Could not save cache: {e}")
+            return False
+
+    def _get_index_filename(self) -> str:
+        """Get the path of the cache index file."""
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _index_entry(self, analysis_data: dict) -> dict:
+        """Extract the cache index metadata from analysis results."""
+        return {
+            'category': analysis_data.get('category'),
+            'total_unique_words': analysis_data.get('total_unique_words', 0),
+            'total_word_occurrences': analysis_data.get('total_word_occurrences', 0),
+            'analyzed_at': analysis_data.get('analyzed_at', 'Unknown')
+        }
+
+    def _load_analysis_metadata(self, cache_file: str) -> dict:
+        """
+        Load the cache index fields of a cached analysis without decoding its
+        word frequency table.
+        """
+        metadata = {}
+        try:
+            with open(cache_file, 'rb') as f:
+                unpacker = msgpack.Unpacker(f, raw=False)
+                for _ in range(unpacker.read_map_header()):
+                    key = unpacker.unpack()
+                    if key in INDEX_FIELDS:
+                        metadata[key] = unpacker.unpack()
+                        if len(metadata) == len(INDEX_FIELDS):
+                            break
+                    else:
+                        unpacker.skip()
+        except (OSError, ValueError, msgpack.UnpackException):
+            return {}
+        return metadata
+
+    def _build_cache_index(self) -> Dict[str, dict]:
+        """Build the cache index by reading every cached analysis file."""
+        index = {}
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('_analysis.msgpack'):
+                analysis_data = self._load_analysis_metadata(os.path.join(self.cache_dir, filename))
+                if analysis_data.get('category'):
+                    index[analysis_data['category']] = self._index_entry(analysis_data)
+        return index
+
+    def _write_cache_index(self, index: Dict[str, dict]):
+        """Atomically replace the cache index file."""
+        index_file = self._get_index_filename()
+        tmp_file = f"{index_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(index, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, index_file)
+        except Exception as e:
+            print(f"Warning: Could not save cache index: {e}")
+
+    @contextmanager
+    def _cache_index_lock(self):
+        """Hold the exclusive lock that serializes writes to the cache index."""
+        with open(f"{self._get_index_filename()}.lock", 'w') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def _load_cache_index(self) -> Dict[str, dict]:
+        """Load the cache index, rebuilding it if missing. Call with the index lock held."""
+        index_file = self._get_index_filename()
+        if os.path.exists(index_file):
+            index = self._load_cache(index_file)
+            if index:
+                return index
+        
+        index = self._build_cache_index()
+        if index:
+            self._write_cache_index(index)
+        return index
+
+    def _update_cache_index(self, analysis_data: dict):
+        """Add or replace a category's entry in the cache index."""
+        try:
+            with self._cache_index_lock():
+                index = self._load_cache_index()
+                index[analysis_data['category']] = self._index_entry(analysis_data)
+                self._write_cache_index(index)
+        except Exception as e:
+            print(f"Warning: Could not update cache index: {e}")
+
+    def get_cache_index(self) -> Dict[str, dict]:
+        """
+        Get metadata for all cached category analyses.
+        
+        The index is rebuilt from the cached analysis files if it is missing.
+        
+        Returns:
+            Dictionary mapping category names to their analysis metadata
+        """
+        index_file = self._get_index_filename()
+        if os.path.exists(index_file):
+            index = self._load_cache(index_file)
+            if index:
+                return index
+        
+        # Rebuild under the lock so a concurrent update is not overwritten
+        try:
+            with self._cache_index_lock():
+                return self._load_cache_index()
+        except Exception as e:
+            print(f"Warning: Could not update cache index: {e}")
+            return self._build_cache_index()
+
+    def get_analysis_mtime(self, category: str) -> Optional[float]:
+        """
+        Get the modification time of a category's cached analysis.
+        
+        Args:
+            category: Category name
+            
+        Returns:
+            Modification timestamp, or None if there is no valid cached analysis
+        """
+        cache_file = self._get_analysis_cache_filename(category)
+        if not self._is_cache_valid(cache_file):
+            return None
+        return os.path.getmtime(cache_file)
 
     def get_category_members(self, category: str) -> List[str]:
         """
@@ -192,11 +401,14 @@ class WikipediaAnalyzer:
             'action': 'query',
             'titles': title,
             'prop': 'extracts',
-            'exintro': False,  # Get full content, not just intro
+            # Full content is returned when 'exintro' is omitted; the API treats
+            # any value (even "False") as a request for the intro only
             'explaintext': True,  # Get plain text, not HTML
             'exsectionformat': 'plain',
             'format': 'json'
         }
+        if self.extract_chars:
+            params['exchars'] = self.extract_chars
         
         try:
             response = self.session.get(self.base_url, params=params)
@@ -214,6 +426,77 @@ class WikipediaAnalyzer:
             print(f"Error fetching content for '{title}': {e}")
             return ""
 
+    async def _fetch_extract(self, http: aiohttp.ClientSession, title: str) -> str:
+        """
+        Get the plain text content of a Wikipedia page.
+        
+        Whole-article extracts (with or without a character limit) are returned
+        one page per query, so each page gets its own request rather than a batch.
+        
+        Args:
+            http: aiohttp session to send the request with
+            title: Page title
+            
+        Returns:
+            Plain text content of the page
+        """
+        params = {
+            'action': 'query',
+            'titles': title,
+            'prop': 'extracts',
+            'explaintext': 1,  # Get plain text, not HTML
+            'exsectionformat': 'plain',
+            'format': 'json'
+        }
+        if self.extract_chars:
+            params['exchars'] = self.extract_chars
+        
+        try:
+            async with http.post(self.base_url, data=params) as response:
+                response.raise_for_status()
+                data = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching content for '{title}': {e}")
+            return ""
+        
+        if 'error' in data:
+            print(f"API Error: {data['error']['info']}")
+            return ""
+        
+        pages = data.get('query', {}).get('pages', {})
+        for page_data in pages.values():
+            if 'extract' in page_data:
+                return page_data['extract']
+        
+        return ""
+
+    async def _fetch_all_extracts(self, page_titles: List[str]) -> Dict[str, str]:
+        """
+        Get the plain text content of all pages, running up to
+        MAX_CONCURRENT_REQUESTS queries concurrently.
+        
+        Args:
+            page_titles: Page titles
+            
+        Returns:
+            Dictionary mapping page titles to their plain text content
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        # One kept-alive connection per concurrent query, reused across pages
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, limit_per_host=MAX_CONCURRENT_REQUESTS)
+        headers = {'User-Agent': self.user_agent}
+        
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as http:
+            async def fetch(title: str) -> str:
+                async with semaphore:
+                    return await self._fetch_extract(http, title)
+            
+            tasks = [asyncio.create_task(fetch(title)) for title in page_titles]
+            results = await asyncio.gather(*tasks)
+        
+        return dict(zip(page_titles, results))
+
     def extract_words(self, text: str) -> List[str]:
         """
         Extract words from text, filtering out non-alphabetic tokens and stop words.
@@ -227,21 +510,26 @@ class WikipediaAnalyzer:
         if not text:
             return []
         
-        # Convert to lowercase and extract words (alphabetic only)
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-        
-        # Filter out stop words and short words (less than 3 characters)
-        filtered_words = [
-            word for word in words 
-            if word not in STOP_WORDS and len(word) >= 3
-        ]
-        
-        return filtered_words
+        # Extract alphabetic words of at least 3 characters and drop stop words
+        return list(_iter_words(text))
 
     def analyze_category(self, category: str) -> Dict[str, int]:
         """
         Analyze all pages in a category and return word frequency.
         
+        Args:
+            category: Category name
+            
+        Returns:
+            Dictionary of word frequencies
+        """
+        return asyncio.run(self.analyze_category_async(category))
+
+    async def analyze_category_async(self, category: str) -> Dict[str, int]:
+        """
+        Analyze all pages in a category and return word frequency, without
+        blocking the running event loop on network, disk or tokenizing work.
+        
         Args:
             category: Category name
             
@@ -249,64 +537,114 @@ class WikipediaAnalyzer:
             Dictionary of word frequencies
         """
         # Check if we have cached analysis results
-        analysis_cache_file = self._get_cache_filename(category, "analysis")
+        analysis_cache_file = self._get_analysis_cache_filename(category)
         if self._is_cache_valid(analysis_cache_file):
-            cached_analysis = self._load_cache(analysis_cache_file)
-            if cached_analysis.get('word_frequencies'):
+            cached_analysis = await asyncio.to_thread(self._load_cache, analysis_cache_file)
+            # Only reuse results computed with the same extract length
+            if (cached_analysis.get('word_frequencies')
+                    and cached_analysis.get('extract_chars') == self.extract_chars):
                 print(f"Loading analysis results from cache for category: {category}")
                 print(f"Found {len(cached_analysis['word_frequencies'])} unique words in cache")
                 print(f"Total word occurrences: {sum(cached_analysis['word_frequencies'].values())}")
                 return cached_analysis['word_frequencies']
         
         # Get all pages in the category
-        page_titles = self.get_category_members(category)
+        page_titles = await asyncio.to_thread(self.get_category_members, category)
         
         if not page_titles:
             print("No pages found in the category.")
             return {}
         
-        # Collect all words from all pages
-        all_words = []
-        processed_pages = 0
-        
         print(f"\nProcessing {len(page_titles)} pages...")
         
-        for i, title in enumerate(page_titles, 1):
-            print(f"Processing page {i}/{len(page_titles)}: {title}")
-            
-            content = self.get_page_content(title)
-            if content:
-                words = self.extract_words(content)
-                all_words.extend(words)
-                processed_pages += 1
-                print(f"  Found {len(words)} non-common words")
-            else:
-                print(f"  No content found")
-            
-            # Small delay to be respectful to the API
-            time.sleep(0.1)
+        contents = await self._fetch_all_extracts(page_titles)
         
-        print(f"\nProcessed {processed_pages} pages successfully")
-        print(f"Total non-common words collected: {len(all_words)}")
+        # Tokenizing is CPU-bound, so keep it off the event loop
+        word_freq, total_words, processed_pages = await asyncio.to_thread(
+            self._count_words, page_titles, contents
+        )
         
-        # Count word frequencies
-        word_freq = Counter(all_words)
         word_freq_dict = dict(word_freq)
         
         # Save analysis results to cache
+        # The word frequency table goes last so the metadata can be read without it
         analysis_data = {
             'category': category,
-            'word_frequencies': word_freq_dict,
             'analyzed_at': datetime.now().isoformat(),
             'total_pages_processed': processed_pages,
             'total_unique_words': len(word_freq_dict),
-            'total_word_occurrences': sum(word_freq_dict.values())
+            'total_word_occurrences': total_words,
+            'extract_chars': self.extract_chars,
+            'word_frequencies': word_freq_dict
         }
-        self._save_cache(analysis_cache_file, analysis_data)
-        print(f"Saved analysis results to cache")
+        await asyncio.to_thread(self._save_analysis, analysis_cache_file, analysis_data)
         
         return word_freq_dict
 
+    def _count_words(self, page_titles: List[str], contents: Dict[str, str]):
+        """
+        Count the non-common words across all fetched pages.
+        
+        Args:
+            page_titles: Page titles, in processing order
+            contents: Dictionary mapping page titles to their plain text content
+            
+        Returns:
+            Tuple of (word frequency Counter, total words counted, pages processed)
+        """
+        # Count words page by page rather than collecting every word first
+        word_freq = Counter()
+        total_words = 0
+        processed_pages = 0
+        
+        for i, title in enumerate(page_titles, 1):
+            print(f"Processing page {i}/{len(page_titles)}: {title}")
+            
+            content = contents.get(title)
+            if content:
+                page_freq = Counter(_iter_words(content))
+                page_words = sum(page_freq.values())
+                word_freq.update(page_freq)
+                total_words += page_words
+                processed_pages += 1
+                print(f"  Found {page_words} non-common words")
+            else:
+                print(f"  No content found")
+        
+        print(f"\nProcessed {processed_pages} pages successfully")
+        print(f"Total non-common words collected: {total_words}")
+        
+        return word_freq, total_words, processed_pages
+
+    def _save_analysis(self, cache_file: str, analysis_data: dict):
+        """Save analysis results to cache and record full-page ones in the cache index."""
+        if self._save_cache(cache_file, analysis_data):
+            # The index lists the full-page analyses the web app serves
+            if not self.extract_chars:
+                self._update_cache_index(analysis_data)
+            print(f"Saved analysis results to cache")
+
+    def _warm_category(self, category: str) -> int:
+        """Analyze a category in a worker process and return its number of unique words."""
+        return len(self.analyze_category(category))
+
+    def warm_categories(self, categories: List[str]) -> Dict[str, int]:
+        """
+        Analyze several categories in parallel worker processes to fill the cache.
+        
+        Args:
+            categories: Category names
+            
+        Returns:
+            Dictionary mapping category names to their number of unique words
+        """
+        if not categories:
+            return {}
+        
+        max_workers = min(MAX_WARM_WORKERS, os.cpu_count() or 1, len(categories))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(categories, executor.map(self._warm_category, categories)))
+
     def print_results(self, word_freq: Dict[str, int], top_n: int = 50):
         """
         Print the word frequency results.
@@ -325,16 +663,23 @@ class WikipediaAnalyzer:
         print(f"Total unique words: {len(word_freq)}")
         print(f"Total word occurrences: {sum(word_freq.values())}")
         
-        # Sort by frequency (descending)
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+        # Select the most frequent words without sorting the whole vocabulary
+        top_words = heapq.nlargest(top_n, word_freq.items(), key=operator.itemgetter(1))
         
-        print(f"\nTop {min(top_n, len(sorted_words))} most frequent words:")
+        print(f"\nTop {len(top_words)} most frequent words:")
         print(f"{'Rank':<6} {'Word':<20} {'Frequency':<10}")
         print("-" * 40)
         
-        for i, (word, freq) in enumerate(sorted_words[:top_n], 1):
+        for i, (word, freq) in enumerate(top_words, 1):
             print(f"{i:<6} {word:<20} {freq:<10}")
 
+def positive_int(value: str) -> int:
+    """argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze word frequency in Wikipedia category pages",
@@ -377,6 +722,12 @@ Examples:
         help='Cache expiry in days (default: 7)'
     )
     
+    parser.add_argument(
+        '--extract-chars',
+        type=positive_int,
+        help=f'Analyze only the first N characters of each page (at most {MAX_EXTRACT_CHARS}; default: full page)'
+    )
+    
     parser.add_argument(
         '--no-cache',
         action='store_true',
@@ -395,7 +746,8 @@ Examples:
         cache_dir = args.cache_dir
         cache_expiry = args.cache_expiry
     
-    analyzer = WikipediaAnalyzer(cache_dir=cache_dir, cache_expiry_days=cache_expiry)
+    analyzer = WikipediaAnalyzer(cache_dir=cache_dir, cache_expiry_days=cache_expiry,
+                                 extract_chars=args.extract_chars)
     
     try:
         word_freq = analyzer.analyze_category(args.category)